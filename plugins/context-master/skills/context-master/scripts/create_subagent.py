@@ -3,7 +3,7 @@
 Create a subagent configuration for Claude Code.
 
 Usage:
-    python create_subagent.py <agent_name> [--type TYPE] [--output DIR]
+    python create_subagent.py <agent_name> [--type TYPE] [--output DIR] [--emit-json]
 
 Types:
     - researcher: For documentation and code searches with deep analysis
@@ -13,13 +13,12 @@ Types:
     - deep_analyzer: For complex decisions requiring extensive thinking
 """
 
-import argparse
-import json
-from pathlib import Path
+import os
+import sys
+from functools import lru_cache
 
 SUBAGENT_TEMPLATES = {
     "researcher": {
-        "name": "{agent_name}",
         "description": "Research and documentation lookup agent with deep analysis",
         "instructions": """You are a research specialist. Your job is to:
 - Search through documentation efficiently
@@ -40,7 +39,6 @@ The main agent needs your INSIGHTS, not raw data.""",
     },
     
     "tester": {
-        "name": "{agent_name}",
         "description": "Testing and validation agent with analysis",
         "instructions": """You are a testing specialist. Your job is to:
 - Execute test suites
@@ -61,7 +59,6 @@ Focus on test execution and insightful result reporting.""",
     },
     
     "analyzer": {
-        "name": "{agent_name}",
         "description": "Code analysis and deep architectural insight agent",
         "instructions": """You are a code analysis specialist. Your job is to:
 - Analyze code structure and patterns
@@ -83,7 +80,6 @@ Provide actionable insights backed by reasoning.""",
     },
     
     "builder": {
-        "name": "{agent_name}",
         "description": "Build and deployment agent",
         "instructions": """You are a build specialist. Your job is to:
 - Execute build processes
@@ -97,7 +93,6 @@ Focus on build execution and clear status reporting. Return success/failure and
     },
     
     "deep_analyzer": {
-        "name": "{agent_name}",
         "description": "Deep analysis agent with mandatory extended thinking",
         "instructions": """You are a deep analysis specialist. Your PRIMARY function is to think deeply before responding.
 
@@ -123,22 +118,26 @@ The main agent trusts your deep analysis. Give them confidence through thorough
     }
 }
 
-CLAUDE_CODE_FORMAT = """# {agent_name}
 
-{description}
-
-## Instructions
-
-{instructions}
-
-## Allowed Tools
-
-{tools}
-
-## Autonomy Level
+def _format_claude_code(
+    agent_name: str,
+    description: str,
+    instructions: str,
+    tools: str,
+    autonomy_description: str
+) -> str:
+    """Render an agent in Claude Code markdown format."""
+    return (
+        f"# {agent_name}\n\n"
+        f"{description}\n\n"
+        f"## Instructions\n\n"
+        f"{instructions}\n\n"
+        f"## Allowed Tools\n\n"
+        f"{tools}\n\n"
+        f"## Autonomy Level\n\n"
+        f"{autonomy_description}\n"
+    )
 
-{autonomy_description}
-"""
 
 AUTONOMY_DESCRIPTIONS = {
     "low": "Ask for confirmation before taking actions. Provide recommendations.",
@@ -146,60 +145,206 @@ AUTONOMY_DESCRIPTIONS = {
     "high": "Execute tasks fully autonomously. Report results when complete."
 }
 
+# Placeholder substituted with the real agent name at creation time
+_AGENT_NAME_PLACEHOLDER = "__AGENT_NAME__"
+_MD_AGENT_NAME_PLACEHOLDER = _AGENT_NAME_PLACEHOLDER.encode("utf-8")
+_JSON_AGENT_NAME_PLACEHOLDER = b'"' + _MD_AGENT_NAME_PLACEHOLDER + b'"'
 
-def create_subagent(agent_name: str, agent_type: str, output_dir: str) -> None:
-    """Create a subagent configuration file."""
-    if agent_type not in SUBAGENT_TEMPLATES:
+def _prerender_template(config: dict) -> bytes:
+    """Render and encode a template's markdown with a placeholder for the agent name."""
+    return _format_claude_code(
+        agent_name=_AGENT_NAME_PLACEHOLDER,
+        description=config["description"],
+        instructions=config["instructions"],
+        tools="\n".join(f"- {tool}" for tool in config["tools"]),
+        autonomy_description=AUTONOMY_DESCRIPTIONS[config["autonomy"]]
+    ).encode("utf-8")
+
+
+# Templates are static, so render them once at import; the encoded markdown
+# needs no further encoding when written
+_RENDERED_TEMPLATES = {
+    agent_type: _prerender_template(config)
+    for agent_type, config in SUBAGENT_TEMPLATES.items()
+}
+
+
+def _get_template(agent_type: str) -> bytes:
+    """Look up a pre-rendered template, raising ValueError for unknown types."""
+    rendered = _RENDERED_TEMPLATES.get(agent_type)
+    if rendered is None:
         raise ValueError(
             f"Unknown agent type: {agent_type}. "
             f"Choose from: {', '.join(SUBAGENT_TEMPLATES.keys())}"
         )
+    return rendered
+
+
+@lru_cache(maxsize=64)
+def _render_subagent(agent_name: str, agent_type: str) -> bytes:
+    """Return the encoded Claude Code markdown for a subagent.
+    
+    Cached so repeated, idempotent runs with the same arguments skip rendering.
+    """
+    return _get_template(agent_type).replace(
+        _MD_AGENT_NAME_PLACEHOLDER, agent_name.encode("utf-8")
+    )
+
+
+@lru_cache(maxsize=None)
+def _json_template(agent_type: str) -> bytes:
+    """Pre-render the encoded JSON body for a template on first use.
     
-    template = SUBAGENT_TEMPLATES[agent_type].copy()
-    template["name"] = agent_name
+    JSON output is opt-in, so json is only imported when it is actually needed.
+    """
+    import json
     
-    # Create output directory
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    config = SUBAGENT_TEMPLATES[agent_type]
+    return json.dumps({"name": _AGENT_NAME_PLACEHOLDER, **config}, indent=2).encode("ascii")
+
+
+def _render_subagent_json(agent_name: str, agent_type: str) -> bytes:
+    """Return the encoded JSON configuration for a subagent."""
+    from json.encoder import encode_basestring_ascii
     
-    # Create .claude/agents directory structure
-    agents_dir = output_path / ".claude" / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
+    _get_template(agent_type)  # Validates agent_type
+    # Only the quoted name varies, so escape it directly rather than re-encoding
+    return _json_template(agent_type).replace(
+        _JSON_AGENT_NAME_PLACEHOLDER,
+        encode_basestring_ascii(agent_name).encode("ascii")
+    )
+
+
+def subagent_to_json(agent_name: str, agent_type: str) -> str:
+    """Return the JSON configuration for a subagent without writing it to disk."""
+    return _render_subagent_json(agent_name, agent_type).decode("ascii")
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """Write content to path with raw os.write calls, skipping the text I/O layer."""
+    data = memoryview(content)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _agents_dir(output_dir: str) -> str:
+    """Create and return the .claude/agents directory under output_dir."""
+    # Create .claude/agents directory structure; makedirs also creates output_dir
+    agents_dir = os.path.join(output_dir, ".claude", "agents")
+    os.makedirs(agents_dir, exist_ok=True)
+    return agents_dir
+
+
+def create_subagent(
+    agent_name: str,
+    agent_type: str,
+    output_dir: str,
+    emit_json: bool = False
+) -> None:
+    """Create a subagent configuration file."""
+    content = _render_subagent(agent_name, agent_type)
+    agents_dir = _agents_dir(output_dir)
     
     # Generate agent file in Claude Code format
-    agent_file = agents_dir / f"{agent_name}.md"
+    agent_file = os.path.join(agents_dir, agent_name + ".md")
+    _write_file(agent_file, content)
     
-    tools_list = "\n".join(f"- {tool}" for tool in template["tools"])
-    autonomy_desc = AUTONOMY_DESCRIPTIONS[template["autonomy"]]
+    # Optionally create a JSON version for programmatic use
+    if emit_json:
+        _write_file(
+            os.path.join(agents_dir, agent_name + ".json"),
+            _render_subagent_json(agent_name, agent_type)
+        )
     
-    content = CLAUDE_CODE_FORMAT.format(
-        agent_name=agent_name,
-        description=template["description"],
-        instructions=template["instructions"],
-        tools=tools_list,
-        autonomy_description=autonomy_desc
-    )
+    # Report the path the way pathlib did, without a leading "./"
+    agent_file = os.path.normpath(agent_file)
+    print("\n".join([
+        f"✅ Created subagent: {agent_name}",
+        f"   Type: {agent_type}",
+        f"   Location: {agent_file}",
+        "\n📝 Next steps:",
+        f"   1. Review and customize {agent_file}",
+        f"   2. Use in Claude Code with: /agent {agent_name}",
+        "   3. Commit to version control",
+        # Usage example
+        "\n💡 Usage example:",
+        f"   /agent {agent_name} [your task description]",
+    ]))
+
+
+def create_subagents(specs: list, output_dir: str, emit_json: bool = False) -> None:
+    """Create several subagents in one pass.
+    
+    specs is a list of (agent_name, agent_type) tuples. All types are validated
+    and all contents rendered before anything is written, and the agents
+    directory is created only once. An empty list does nothing.
+    """
+    if not specs:
+        return
     
-    agent_file.write_text(content)
+    rendered = [
+        (
+            agent_name,
+            _render_subagent(agent_name, agent_type),
+            _render_subagent_json(agent_name, agent_type) if emit_json else None
+        )
+        for agent_name, agent_type in specs
+    ]
+    
+    agents_dir = _agents_dir(output_dir)
+    for agent_name, content, json_content in rendered:
+        _write_file(os.path.join(agents_dir, agent_name + ".md"), content)
+        if json_content is not None:
+            _write_file(os.path.join(agents_dir, agent_name + ".json"), json_content)
     
-    # Also create a JSON version for programmatic use
-    json_file = agents_dir / f"{agent_name}.json"
-    json_file.write_text(json.dumps(template, indent=2))
+    print("\n".join([
+        f"✅ Created {len(specs)} subagent{'' if len(specs) == 1 else 's'} "
+        f"in {os.path.normpath(agents_dir)}",
+        *(f"   - {agent_name} ({agent_type})" for agent_name, agent_type in specs),
+    ]))
+
+
+def _parse_args_fast(argv: list):
+    """Parse the common command-line forms without importing argparse.
     
-    print(f"✅ Created subagent: {agent_name}")
-    print(f"   Type: {agent_type}")
-    print(f"   Location: {agent_file}")
-    print(f"\n📝 Next steps:")
-    print(f"   1. Review and customize {agent_file}")
-    print(f"   2. Use in Claude Code with: /agent {agent_name}")
-    print(f"   3. Commit to version control")
+    Returns (agent_name, agent_type, output_dir, emit_json), or None when argv
+    needs the full argparse parser: help, unknown or abbreviated options,
+    missing or invalid values.
+    """
+    positionals = []
+    options = {"--type": "researcher", "--output": "."}
+    emit_json = False
+    args = iter(argv)
+    for arg in args:
+        if not arg.startswith("-"):
+            positionals.append(arg)
+            continue
+        if arg == "--emit-json":
+            emit_json = True
+            continue
+        option, sep, value = arg.partition("=")
+        if option not in options:
+            return None
+        if not sep:
+            value = next(args, None)
+            if value is None or value.startswith("-"):
+                return None
+        options[option] = value
     
-    # Print usage example
-    print(f"\n💡 Usage example:")
-    print(f"   /agent {agent_name} [your task description]")
+    if len(positionals) != 1 or options["--type"] not in SUBAGENT_TEMPLATES:
+        return None
+    return positionals[0], options["--type"], options["--output"], emit_json
 
 
-def main():
+def _parse_args(argv: list):
+    """Parse argv with argparse; handles --help and reports usage errors."""
+    # Imported lazily: argparse is only needed off the fast path
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Create a subagent configuration for Claude Code"
     )
@@ -209,7 +354,7 @@ def main():
     )
     parser.add_argument(
         "--type",
-        choices=list(SUBAGENT_TEMPLATES.keys()),
+        choices=SUBAGENT_TEMPLATES,
         default="researcher",
         help="Type of subagent to create"
     )
@@ -218,10 +363,23 @@ def main():
         default=".",
         help="Output directory (default: current directory)"
     )
+    parser.add_argument(
+        "--emit-json",
+        action="store_true",
+        help="Also write a JSON version of the agent for programmatic use"
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.agent_name, args.type, args.output, args.emit_json
+
+
+def main():
+    argv = sys.argv[1:]
+    agent_name, agent_type, output_dir, emit_json = (
+        _parse_args_fast(argv) or _parse_args(argv)
+    )
     
-    create_subagent(args.agent_name, args.type, args.output)
+    create_subagent(agent_name, agent_type, output_dir, emit_json)
 
 
 if __name__ == "__main__":